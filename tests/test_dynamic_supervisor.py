@@ -119,3 +119,41 @@ async def test_no_restart(strategy, log_handler, mailbox_env):
 
     assert test_data.exec_count == 1
     assert not log_handler.has_errors
+
+
+async def test_buffered_start_child(log_handler, mailbox_env):
+    events = []
+
+    async def sample_child(i):
+        events.append(("run", i))
+
+    async def start_child(mid, i):
+        child_spec = supervisor.child_spec(
+            id=f"sample_task_{i}",
+            task=sample_child,
+            args=[i],
+            restart=supervisor.restart_strategy.TEMPORARY,
+        )
+        await dynamic_supervisor.start_child(mid, child_spec)
+        events.append(("sent", i))
+
+    async with trio.open_nursery() as nursery:
+        opts = supervisor.options()
+        mid = await nursery.start(dynamic_supervisor.start, opts, None, 4)
+
+        # Let the supervisor wait for requests
+        await trio.sleep(0.1)
+
+        # The requests are all sent in the same scheduler batch: the first one
+        # is handed to the waiting supervisor, the others must be buffered for
+        # start_child() to return before the supervisor runs again
+        async with trio.open_nursery() as senders:
+            for i in range(5):
+                senders.start_soon(start_child, mid, i)
+
+        await trio.sleep(0.1)
+        nursery.cancel_scope.cancel()
+
+    assert [event for event, _ in events[:5]] == ["sent"] * 5
+    assert sorted(events[5:]) == [("run", i) for i in range(5)]
+    assert not log_handler.has_errors
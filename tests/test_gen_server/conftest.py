@@ -10,6 +10,8 @@ class GenServerTestState:
         self.stopped = trio.Event()
         self.info = trio.Event()
         self.casted = trio.Event()
+        self.blocked = trio.Event()
+        self.unblock = trio.Event()
 
         self.data = {}
         self.did_raise = None
@@ -18,6 +20,9 @@ class GenServerTestState:
         self.info_val = None
         self.unknown_info = []
 
+        self.counted = []
+        self.late_caller = None
+
 
 @pytest.fixture
 async def test_state(mailbox_env):
@@ -32,3 +37,18 @@ async def test_state(mailbox_env):
         yield test_state
 
         nursery.cancel_scope.cancel()
+
+
+@pytest.fixture
+async def buffered_test_state(mailbox_env):
+    test_state = GenServerTestState()
+
+    async with trio.open_nursery() as nursery:
+        nursery.start_soon(sample_kvstore.start, test_state, 256)
+
+        with trio.fail_after(0.1):
+            await test_state.ready.wait()
+
+        yield test_state
+
+        nursery.cancel_scope.cancel()
@@ -6,9 +6,11 @@ import trio
 __module__ = current_module()
 
 
-async def start(test_state):
+async def start(test_state, buffer_size=0):
     try:
-        await gen_server.start(__module__, test_state, name=__name__)
+        await gen_server.start(
+            __module__, test_state, name=__name__, buffer_size=buffer_size
+        )
 
     except Exception as err:
         test_state.did_raise = err
@@ -56,6 +58,10 @@ class special_call:
     async def failure():
         return await gen_server.call(__name__, "special_call_failure")
 
+    @staticmethod
+    async def late(timeout):
+        return await gen_server.call(__name__, "special_call_late", timeout=timeout)
+
 
 class special_cast:
     """
@@ -74,6 +80,18 @@ class special_cast:
     async def fail():
         await gen_server.cast(__name__, "special_cast_fail")
 
+    @staticmethod
+    async def block():
+        await gen_server.cast(__name__, "special_cast_block")
+
+    @staticmethod
+    async def count(val):
+        await gen_server.cast(__name__, ("special_cast_count", val))
+
+    @staticmethod
+    async def late_reply():
+        await gen_server.cast(__name__, "special_cast_late_reply")
+
 
 class special_info:
     """
@@ -128,6 +146,10 @@ async def handle_call(message, caller, test_state):
         case "special_call_timedout":
             return (gen_server.NoReply(), test_state)
 
+        case "special_call_late":
+            test_state.late_caller = caller
+            return (gen_server.NoReply(), test_state)
+
         case "special_call_stopped":
             return (gen_server.Stop(), test_state)
 
@@ -149,6 +171,20 @@ async def handle_cast(message, test_state):
         case "special_cast_stop":
             return (gen_server.Stop(), test_state)
 
+        case "special_cast_block":
+            test_state.blocked.set()
+            await test_state.unblock.wait()
+            return (gen_server.NoReply(), test_state)
+
+        case ("special_cast_count", val):
+            test_state.counted.append(val)
+            return (gen_server.NoReply(), test_state)
+
+        case "special_cast_late_reply":
+            await gen_server.reply(test_state.late_caller, "late")
+            test_state.casted.set()
+            return (gen_server.NoReply(), test_state)
+
         case _:
             exc = NotImplementedError("wrong cast")
             return (gen_server.Stop(exc), test_state)
@@ -38,3 +38,17 @@ async def test_kvstore_call_failure(test_state):
 
     assert isinstance(test_state.terminated_with, RuntimeError)
     assert test_state.did_raise is test_state.terminated_with
+
+
+async def test_kvstore_call_late_reply(test_state):
+    with pytest.raises(trio.TooSlowError):
+        await kvstore.special_call.late(0.01)
+
+    # Replying to a caller that gave up is silently dropped
+    await kvstore.special_cast.late_reply()
+
+    with trio.fail_after(0.1):
+        await test_state.casted.wait()
+
+    assert await kvstore.api.get("key") is None
+    assert not test_state.stopped.is_set()
@@ -1,7 +1,27 @@
 from . import sample_kvstore as kvstore
+
+from triotp import gen_server
 import trio
 
 
+class BatchRecorder(trio.abc.Instrument):
+    """
+    Record how many casts are handled in each run of a task between two
+    scheduler checkpoints.
+    """
+
+    def __init__(self, test_state):
+        self.test_state = test_state
+        self.handled = 0
+        self.batches = []
+
+    def after_task_step(self, task):
+        handled = len(self.test_state.counted)
+        if handled != self.handled:
+            self.batches.append(handled - self.handled)
+            self.handled = handled
+
+
 async def test_kvstore_cast_normal(test_state):
     await kvstore.special_cast.normal()
 
@@ -27,3 +47,64 @@ async def test_kvstore_cast_fail(test_state):
 
     assert isinstance(test_state.terminated_with, NotImplementedError)
     assert test_state.did_raise is test_state.terminated_with
+
+
+async def test_kvstore_cast_batch(buffered_test_state):
+    test_state = buffered_test_state
+    count = 2 * gen_server._MAX_BATCH + 22
+
+    # Keep the server busy while the casts pile up in its mailbox
+    await kvstore.special_cast.block()
+
+    with trio.fail_after(0.1):
+        await test_state.blocked.wait()
+
+    for val in range(count):
+        await kvstore.special_cast.count(val)
+
+    recorder = BatchRecorder(test_state)
+    trio.lowlevel.add_instrument(recorder)
+
+    try:
+        test_state.unblock.set()
+
+        with trio.fail_after(0.1):
+            while len(test_state.counted) < count:
+                await trio.sleep(0)
+
+    finally:
+        trio.lowlevel.remove_instrument(recorder)
+
+    assert test_state.counted == list(range(count))
+    # The blocking cast started the first batch
+    assert recorder.batches == [
+        gen_server._MAX_BATCH - 1,
+        gen_server._MAX_BATCH,
+        23,
+    ]
+
+
+async def test_kvstore_cast_stop_in_batch(buffered_test_state):
+    test_state = buffered_test_state
+
+    await kvstore.special_cast.block()
+
+    with trio.fail_after(0.1):
+        await test_state.blocked.wait()
+
+    for val in range(10):
+        await kvstore.special_cast.count(val)
+
+    await kvstore.special_cast.stop()
+
+    for val in range(10, 20):
+        await kvstore.special_cast.count(val)
+
+    test_state.unblock.set()
+
+    with trio.fail_after(0.1):
+        await test_state.stopped.wait()
+
+    assert test_state.counted == list(range(10))
+    assert test_state.terminated_with is None
+    assert test_state.did_raise is None
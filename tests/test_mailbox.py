@@ -123,3 +123,27 @@ async def test_unregister(mailbox_env):
 async def test_destroy_unknown(mailbox_env):
     with pytest.raises(mailbox.MailboxDoesNotExist):
         await mailbox.destroy("not-found")
+
+
+async def test_buffered(mailbox_env):
+    async with mailbox.open(buffer_size=2) as mid:
+        with trio.fail_after(0.1):
+            await mailbox.send(mid, "foo")
+            await mailbox.send(mid, "bar")
+
+        assert await mailbox.receive(mid) == "foo"
+        assert await mailbox.receive(mid) == "bar"
+
+
+async def test_destroy_unregister_all(mailbox_env):
+    async with mailbox.open("foo") as mid:
+        mailbox.register(mid, "bar")
+
+    with pytest.raises(mailbox.MailboxDoesNotExist):
+        await mailbox.send("foo", "baz")
+
+    with pytest.raises(mailbox.MailboxDoesNotExist):
+        await mailbox.send("bar", "baz")
+
+    async with mailbox.open("foo") as mid:
+        mailbox.register(mid, "bar")
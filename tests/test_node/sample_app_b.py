@@ -0,0 +1,2 @@
+async def start(test_data):
+    test_data.count += 1
@@ -1,6 +1,6 @@
 from triotp import node, application
 
-from . import sample_app
+from . import sample_app, sample_app_b
 
 
 def test_node_run(test_data):
@@ -13,3 +13,22 @@ def test_node_run(test_data):
     )
 
     assert test_data.count == 1
+
+
+def test_node_run_parallel_start(test_data):
+    node.run(
+        apps=[
+            application.app_spec(
+                module=sample_app, start_arg=test_data, permanent=False
+            ),
+            application.app_spec(
+                module=sample_app_b, start_arg=test_data, permanent=False
+            ),
+            application.app_spec(
+                module=sample_app, start_arg=test_data, permanent=False
+            ),
+        ],
+        parallel_start=True,
+    )
+
+    assert test_data.count == 2
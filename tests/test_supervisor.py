@@ -1,6 +1,6 @@
 import pytest
 
-from triotp import supervisor
+from triotp import supervisor, mailbox
 import trio
 
 
@@ -72,6 +72,154 @@ async def test_automatic_restart_crash(max_restarts, strategy, log_handler):
     assert log_handler.has_errors
 
 
+async def test_restart_backoff(log_handler, autojump_clock):
+    test_data = SampleData()
+
+    with pytest.raises(RuntimeError):
+        async with trio.open_nursery() as nursery:
+            children = [
+                supervisor.child_spec(
+                    id="sample_task",
+                    task=sample_task_error,
+                    args=[test_data],
+                ),
+            ]
+            opts = supervisor.options(
+                max_restarts=3,
+                max_seconds=60,
+                base_delay=1,
+                max_delay=2,
+            )
+            await nursery.start(supervisor.start, children, opts)
+
+    assert test_data.exec_count == 4
+    assert 0 < trio.current_time() <= 1 + 2 + 2
+
+
+async def test_restart_backoff_growth(log_handler, autojump_clock, monkeypatch):
+    # Always wait for the upper bound of the delay
+    monkeypatch.setattr("random.uniform", lambda a, b: b)
+    start_times = []
+
+    async def failing_task():
+        start_times.append(trio.current_time())
+        raise RuntimeError("pytest")
+
+    with pytest.raises(RuntimeError):
+        async with trio.open_nursery() as nursery:
+            children = [
+                supervisor.child_spec(
+                    id="sample_task",
+                    task=failing_task,
+                    args=[],
+                ),
+            ]
+            opts = supervisor.options(
+                max_restarts=5,
+                max_seconds=60,
+                base_delay=1,
+                max_delay=4,
+            )
+            await nursery.start(supervisor.start, children, opts)
+
+    delays = [b - a for a, b in zip(start_times, start_times[1:])]
+    assert delays == [1, 2, 4, 4, 4]
+
+
+async def test_restart_backoff_reset(log_handler, autojump_clock, monkeypatch):
+    # Always wait for the upper bound of the delay
+    monkeypatch.setattr("random.uniform", lambda a, b: b)
+    run_times = []
+    run_durations = iter([0, 0, 100, 0])
+
+    async def flaky_task():
+        start = trio.current_time()
+        duration = next(run_durations, None)
+        if duration is not None:
+            await trio.sleep(duration)
+
+        run_times.append((start, trio.current_time()))
+        if duration is not None:
+            raise RuntimeError("pytest")
+
+    async with trio.open_nursery() as nursery:
+        children = [
+            supervisor.child_spec(
+                id="sample_task",
+                task=flaky_task,
+                args=[],
+                restart=supervisor.restart_strategy.TRANSIENT,
+            ),
+        ]
+        opts = supervisor.options(
+            max_restarts=3,
+            max_seconds=10,
+            base_delay=1,
+            max_delay=8,
+        )
+        await nursery.start(supervisor.start, children, opts)
+
+    delays = [start - end for (_, end), (start, _) in zip(run_times, run_times[1:])]
+    assert delays == [1, 2, 1, 2]
+
+
+async def test_restart_without_timespan(log_handler):
+    test_data = SampleData()
+
+    async def flaky_task(test_data):
+        test_data.exec_count += 1
+        if test_data.exec_count <= 10:
+            raise RuntimeError("pytest")
+
+    async with trio.open_nursery() as nursery:
+        children = [
+            supervisor.child_spec(
+                id="sample_task",
+                task=flaky_task,
+                args=[test_data],
+                restart=supervisor.restart_strategy.TRANSIENT,
+            ),
+        ]
+        opts = supervisor.options(
+            max_restarts=1,
+            max_seconds=0,
+        )
+        await nursery.start(supervisor.start, children, opts)
+
+    assert test_data.exec_count == 11
+    assert log_handler.has_errors
+
+
+async def test_cancel_nested_nursery(log_handler, autojump_clock):
+    test_data = SampleData()
+
+    async def nested_task(test_data):
+        test_data.exec_count += 1
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(trio.sleep_forever)
+            nursery.start_soon(trio.sleep_forever)
+
+    with trio.move_on_after(1):
+        async with trio.open_nursery() as nursery:
+            children = [
+                supervisor.child_spec(
+                    id="sample_task",
+                    task=nested_task,
+                    args=[test_data],
+                ),
+            ]
+            opts = supervisor.options(
+                max_restarts=3,
+                max_seconds=5,
+            )
+            await nursery.start(supervisor.start, children, opts)
+
+    assert test_data.exec_count == 1
+    assert not log_handler.has_errors
+    assert log_handler.has_info("task cancelled", channel="sample_task")
+
+
 @pytest.mark.parametrize(
     "strategy",
     [
@@ -99,3 +247,38 @@ async def test_no_restart(strategy, log_handler):
 
     assert test_data.exec_count == 1
     assert not log_handler.has_errors
+
+
+async def test_start_in_order(log_handler, mailbox_env):
+    test_data = SampleData()
+
+    async def server(test_data):
+        async with mailbox.open("pytest") as mid:
+            await mailbox.receive(mid)
+            test_data.exec_count += 1
+
+    async def client():
+        await mailbox.send("pytest", "hello")
+
+    # Sibling children are scheduled in a random order, try several times
+    for _ in range(20):
+        async with trio.open_nursery() as nursery:
+            children = [
+                supervisor.child_spec(
+                    id="server",
+                    task=server,
+                    args=[test_data],
+                    restart=supervisor.restart_strategy.TEMPORARY,
+                ),
+                supervisor.child_spec(
+                    id="client",
+                    task=client,
+                    args=[],
+                    restart=supervisor.restart_strategy.TEMPORARY,
+                ),
+            ]
+            opts = supervisor.options()
+            await nursery.start(supervisor.start, children, opts)
+
+    assert test_data.exec_count == 20
+    assert not log_handler.has_errors
@@ -25,7 +25,7 @@ context_app_nursery = ContextVar("app_nursery")
 context_app_registry = ContextVar("app_registry")
 
 
-@dataclass
+@dataclass(slots=True)
 class app_spec:
     """Describe an application"""
 
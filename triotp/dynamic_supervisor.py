@@ -48,6 +48,7 @@ from typing import Optional, Union
 async def start(
     opts: supervisor.options,
     name: Optional[str] = None,
+    buffer_size: int = 0,
     task_status=trio.TASK_STATUS_IGNORED,
 ) -> None:
     """
@@ -57,6 +58,8 @@ async def start(
 
     :param opts: Supervisor options
     :param name: Optional name to use to register the supervisor's mailbox
+    :param buffer_size: Number of requests the supervisor's mailbox can hold
+                        before `start_child()` blocks
     :param task_status: Used to notify the trio nursery that the supervisor is ready
     :raises triotp.mailbox.NameAlreadyExist: If the `name` was already registered
 
@@ -76,7 +79,7 @@ async def start(
                await dynamic_supervisor.start_child(mid, child_spec)
     """
 
-    async with mailbox.open(name) as mid:
+    async with mailbox.open(name, buffer_size) as mid:
         task_status.started(mid)
 
         async with trio.open_nursery() as nursery:
@@ -103,14 +106,11 @@ async def _child_listener(
     nursery: trio.Nursery,
     task_status=trio.TASK_STATUS_IGNORED,
 ) -> None:
+    receive = mailbox._get_receive_channel(mid).receive
     task_status.started(None)
 
     while True:
-        request = await mailbox.receive(mid)
+        request = await receive()
 
-        match request:
-            case supervisor.child_spec() as spec:
-                await nursery.start(supervisor._child_monitor, spec, opts)
-
-            case _:
-                pass
+        if type(request) is supervisor.child_spec:
+            nursery.start_soon(supervisor._supervise_one, request, opts)
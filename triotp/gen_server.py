@@ -109,12 +109,15 @@ from triotp import mailbox, logging
 from dataclasses import dataclass
 import trio
 
-from typing import TypeVar, Union, Optional, Any
+from collections.abc import Callable, Awaitable
+from typing import NamedTuple, TypeVar, Union, Optional, Any
 from types import ModuleType
 
 
 State = TypeVar("State")
 
+_MAX_BATCH = 64  # messages handled between two scheduler checkpoints
+
 
 class GenServerExited(Exception):
     """
@@ -122,20 +125,13 @@ class GenServerExited(Exception):
     """
 
 
-@dataclass
-class _Loop:
-    yes: bool
-
-
-@dataclass
-class _Raise:
-    exc: BaseException
-
+# After each message, the loop either continues, stops, or raises the
+# exception the generic server should exit with.
+_CONTINUE = object()
+_STOP = object()
 
-Continuation = Union[_Loop, _Raise]
 
-
-@dataclass
+@dataclass(slots=True)
 class Reply:
     """
     Return an instance of this class to send a reply to the caller.
@@ -144,14 +140,14 @@ class Reply:
     payload: Any  #: The response to send back
 
 
-@dataclass
+@dataclass(slots=True)
 class NoReply:
     """
     Return an instance of this class to not send a reply to the caller.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class Stop:
     """
     Return an instance of this class to stop the generic server.
@@ -162,14 +158,20 @@ class Stop:
     )
 
 
-@dataclass
-class _CallMessage:
-    source: trio.MemorySendChannel
+class _CallSlot:
+    __slots__ = ("event", "value")
+
+    def __init__(self) -> None:
+        self.event = trio.Event()
+        self.value = None
+
+
+class _CallMessage(NamedTuple):
+    source: _CallSlot
     payload: Any
 
 
-@dataclass
-class _CastMessage:
+class _CastMessage(NamedTuple):
     payload: Any
 
 
@@ -177,6 +179,7 @@ async def start(
     module: ModuleType,
     init_arg: Optional[Any] = None,
     name: Optional[str] = None,
+    buffer_size: int = 0,
 ) -> None:
     """
     Starts the generic server loop.
@@ -184,12 +187,16 @@ async def start(
     :param module: Module containing the generic server's callbacks
     :param init_arg: Optional argument passed to the `init` callback
     :param name: Optional name to use to register the generic server's mailbox
+    :param buffer_size: Number of messages the generic server's mailbox can
+                        hold, a buffered mailbox lets senders queue casts and
+                        messages while the server is busy instead of waiting
+                        for it
 
     :raises triotp.mailbox.NameAlreadyExist: If the `name` was already registered
     :raises Exception: If the generic server terminated with a non-null reason
     """
 
-    await _loop(module, init_arg, name)
+    await _loop(module, init_arg, name, buffer_size)
 
 
 async def call(
@@ -200,9 +207,8 @@ async def call(
     """
     Send a request to the generic server and wait for a response.
 
-    This function creates a temporary bi-directional channel. The writer is
-    passed to the `handle_call` function and is used to send the response back
-    to the caller.
+    This function creates a reply slot which is passed to the `handle_call`
+    function and is used to send the response back to the caller.
 
     :param name_or_mid: The generic server's mailbox identifier
     :param payload: The message to send to the generic server
@@ -213,27 +219,24 @@ async def call(
 
     """
 
-    wchan, rchan = trio.open_memory_channel(0)
-    message = _CallMessage(source=wchan, payload=payload)
+    caller = _CallSlot()
+    message = _CallMessage(source=caller, payload=payload)
 
     await mailbox.send(name_or_mid, message)
 
-    try:
-        if timeout is not None:
-            with trio.fail_after(timeout):
-                val = await rchan.receive()
+    if timeout is not None:
+        with trio.fail_after(timeout):
+            await caller.event.wait()
 
-        else:
-            val = await rchan.receive()
+    else:
+        await caller.event.wait()
 
-        if isinstance(val, Exception):
-            raise val
+    val = caller.value
 
-        return val
+    if isinstance(val, Exception):
+        raise val
 
-    finally:
-        await wchan.aclose()
-        await rchan.aclose()
+    return val
 
 
 async def cast(
@@ -251,13 +254,13 @@ async def cast(
     await mailbox.send(name_or_mid, message)
 
 
-async def reply(caller: trio.MemorySendChannel, response: Any) -> None:
+async def reply(caller: _CallSlot, response: Any) -> None:
     """
     The `handle_call` callback can start a background task to handle a slow
     request and return a `NoReply` instance. Use this function in the background
     task to send the response to the caller at a later time.
 
-    :param caller: The caller `SendChannel` to use to send the response
+    :param caller: The caller received by `handle_call`
     :param response: The response to send back to the caller
 
     .. code-block:: python
@@ -286,171 +289,146 @@ async def reply(caller: trio.MemorySendChannel, response: Any) -> None:
            return (gen_server.NoReply(), state)
     """
 
-    await caller.send(response)
+    _reply_nowait(caller, response)
+    await trio.lowlevel.checkpoint()
+
+
+def _reply_nowait(caller: _CallSlot, response: Any) -> None:
+    if not caller.event.is_set():
+        caller.value = response
+        caller.event.set()
 
 
 async def _loop(
     module: ModuleType,
     init_arg: Optional[Any],
     name: Optional[str],
+    buffer_size: int,
 ) -> None:
-    async with mailbox.open(name) as mid:
+    handle_call = getattr(module, "handle_call", None)
+    handle_cast = getattr(module, "handle_cast", None)
+    handle_info = getattr(module, "handle_info", None)
+    terminate = getattr(module, "terminate", None)
+
+    async with mailbox.open(name, buffer_size) as mid:
+        rchan = mailbox._get_receive_channel(mid)
+        receive = rchan.receive
+        receive_nowait = rchan.receive_nowait
+
         try:
-            state = await _init(module, init_arg)
+            state = await module.init(init_arg)
             looping = True
 
             while looping:
-                message = await mailbox.receive(mid)
+                message = await receive()
+                pending = _MAX_BATCH
 
-                match message:
-                    case _CallMessage(source, payload):
-                        continuation, state = await _handle_call(
-                            module, payload, source, state
-                        )
+                # Handle the messages already waiting in the mailbox before
+                # going back to the scheduler.
+                while True:
+                    message_type = type(message)
 
-                    case _CastMessage(payload):
-                        continuation, state = await _handle_cast(module, payload, state)
+                    if message_type is _CallMessage:
+                        if handle_call is None:
+                            raise NotImplementedError(f"{module.__name__}.handle_call")
 
-                    case _:
-                        continuation, state = await _handle_info(module, message, state)
+                        source = message.source
+                        result = await handle_call(message.payload, source, state)
 
-                match continuation:
-                    case _Loop(yes=False):
-                        looping = False
+                        match result:
+                            case (Reply(payload), new_state):
+                                state = new_state
+                                _reply_nowait(source, payload)
+                                continuation = _CONTINUE
 
-                    case _Loop(yes=True):
-                        looping = True
+                            case (NoReply(), new_state):
+                                state = new_state
+                                continuation = _CONTINUE
 
-                    case _Raise(exc=err):
-                        raise err
+                            case (Stop(reason), new_state):
+                                state = new_state
+                                _reply_nowait(source, GenServerExited())
+                                continuation = _STOP if reason is None else reason
 
-        except Exception as err:
-            await _terminate(module, err, state)
-            raise err from None
+                            case _:
+                                raise TypeError(
+                                    f"{module.__name__}.handle_call did not return a valid value"
+                                )
 
-        else:
-            await _terminate(module, None, state)
+                    elif message_type is _CastMessage:
+                        if handle_cast is None:
+                            raise NotImplementedError(f"{module.__name__}.handle_cast")
 
+                        result = await handle_cast(message.payload, state)
 
-async def _init(module: ModuleType, init_arg: Any) -> State:
-    return await module.init(init_arg)
+                        match result:
+                            case (NoReply(), new_state):
+                                state = new_state
+                                continuation = _CONTINUE
 
+                            case (Stop(reason), new_state):
+                                state = new_state
+                                continuation = _STOP if reason is None else reason
 
-async def _terminate(
-    module: ModuleType,
-    reason: Optional[BaseException],
-    state: State,
-) -> None:
-    handler = getattr(module, "terminate", None)
-    if handler is not None:
-        await handler(reason, state)
+                            case _:
+                                raise TypeError(
+                                    f"{module.__name__}.handle_cast did not return a valid value"
+                                )
 
-    elif reason is not None:
-        logger = logging.getLogger(module.__name__)
-        logger.exception(reason)
+                    elif handle_info is not None:
+                        result = await handle_info(message, state)
 
+                        match result:
+                            case (NoReply(), new_state):
+                                state = new_state
+                                continuation = _CONTINUE
 
-async def _handle_call(
-    module: ModuleType,
-    message: Any,
-    source: trio.MemorySendChannel,
-    state: State,
-) -> tuple[Continuation, State]:
-    handler = getattr(module, "handle_call", None)
-    if handler is None:
-        raise NotImplementedError(f"{module.__name__}.handle_call")
+                            case (Stop(reason), new_state):
+                                state = new_state
+                                continuation = _STOP if reason is None else reason
 
-    result = await handler(message, source, state)
+                            case _:
+                                raise TypeError(
+                                    f"{module.__name__}.handle_info did not return a valid value"
+                                )
 
-    match result:
-        case (Reply(payload), new_state):
-            state = new_state
-            await reply(source, payload)
-            continuation = _Loop(yes=True)
+                    else:
+                        continuation = _CONTINUE
 
-        case (NoReply(), new_state):
-            state = new_state
-            continuation = _Loop(yes=True)
+                    if continuation is not _CONTINUE:
+                        if continuation is _STOP:
+                            looping = False
+                            break
 
-        case (Stop(reason), new_state):
-            state = new_state
-            await reply(source, GenServerExited())
+                        raise continuation
 
-            if reason is not None:
-                continuation = _Raise(reason)
+                    pending -= 1
+                    if not pending:
+                        break
 
-            else:
-                continuation = _Loop(yes=False)
+                    try:
+                        message = receive_nowait()
 
-        case _:
-            raise TypeError(
-                f"{module.__name__}.handle_call did not return a valid value"
-            )
+                    except trio.WouldBlock:
+                        break
 
-    return continuation, state
-
-
-async def _handle_cast(
-    module: ModuleType,
-    message: Any,
-    state: State,
-) -> tuple[Continuation, State]:
-    handler = getattr(module, "handle_cast", None)
-    if handler is None:
-        raise NotImplementedError(f"{module.__name__}.handle_cast")
-
-    result = await handler(message, state)
-
-    match result:
-        case (NoReply(), new_state):
-            state = new_state
-            continuation = _Loop(yes=True)
-
-        case (Stop(reason), new_state):
-            state = new_state
-
-            if reason is not None:
-                continuation = _Raise(reason)
-
-            else:
-                continuation = _Loop(yes=False)
-
-        case _:
-            raise TypeError(
-                f"{module.__name__}.handle_cast did not return a valid value"
-            )
+        except Exception as err:
+            await _terminate(module, terminate, err, state)
+            raise err from None
 
-    return continuation, state
+        else:
+            await _terminate(module, terminate, None, state)
 
 
-async def _handle_info(
+async def _terminate(
     module: ModuleType,
-    message: Any,
+    handler: Optional[Callable[..., Awaitable[None]]],
+    reason: Optional[BaseException],
     state: State,
-) -> tuple[Continuation, State]:
-    handler = getattr(module, "handle_info", None)
-    if handler is None:
-        return _Loop(yes=True), state
-
-    result = await handler(message, state)
-
-    match result:
-        case (NoReply(), new_state):
-            state = new_state
-            continuation = _Loop(yes=True)
-
-        case (Stop(reason), new_state):
-            state = new_state
-
-            if reason is not None:
-                continuation = _Raise(reason)
-
-            else:
-                continuation = _Loop(yes=False)
-
-        case _:
-            raise TypeError(
-                f"{module.__name__}.handle_info did not return a valid value"
-            )
+) -> None:
+    if handler is not None:
+        await handler(reason, state)
 
-    return continuation, state
+    elif reason is not None:
+        logger = logging.getLogger(module.__name__)
+        logger.exception(reason)
@@ -22,6 +22,14 @@ def current_module() -> ModuleType:
            return current_module()  # THIS WON'T WORK
     """
 
+    caller_frame = sys._getframe(1)
+
+    if caller_frame.f_code.co_name == "<module>":
+        caller_module = sys.modules.get(caller_frame.f_globals.get("__name__"))
+
+        if caller_module is not None:
+            return caller_module
+
     stack_frame = inspect.currentframe()
 
     while stack_frame:
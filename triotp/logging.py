@@ -28,7 +28,14 @@ class LogLevel(Enum):
         :returns: Logbook log level
         """
 
-        return logbook.lookup_level(self.name)
+        return _LOGBOOK_LEVELS[self]
+
+
+_LOGBOOK_LEVELS = {
+    level: logbook.lookup_level(level.name)
+    for level in LogLevel
+    if level is not LogLevel.NONE
+}
 
 
 def getLogger(name: str) -> logbook.Logger:
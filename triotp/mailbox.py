@@ -38,19 +38,23 @@ tasks to communicate with each other.
 """
 
 from contextlib import asynccontextmanager
-from contextvars import ContextVar
-from uuid import uuid4
+from itertools import count
 import trio
 
 from collections.abc import Callable, Awaitable
-from typing import TypeVar, Union, Optional, Any, AsyncContextManager
+from typing import Union, Optional, Any, AsyncContextManager
 
 
-MailboxID = TypeVar("MailboxID", bound=str)  #: Mailbox identifier (UUID4)
+MailboxID = int  #: Mailbox identifier (unique within the process)
 
 
-context_mailbox_registry = ContextVar("mailbox_registry")
-context_name_registry = ContextVar("name_registry")
+_mailbox_ids = count(1)
+
+_mailbox_registry: dict[
+    MailboxID, tuple[trio.MemorySendChannel, trio.MemoryReceiveChannel]
+] = {}
+_name_registry: dict[str, MailboxID] = {}
+_names_by_mailbox: dict[MailboxID, set[str]] = {}
 
 
 class MailboxDoesNotExist(RuntimeError):
@@ -82,21 +86,23 @@ class NameDoesNotExist(RuntimeError):
 
 
 def _init() -> None:
-    context_mailbox_registry.set({})
-    context_name_registry.set({})
+    _mailbox_registry.clear()
+    _name_registry.clear()
+    _names_by_mailbox.clear()
 
 
-def create() -> MailboxID:
+def create(buffer_size: int = 0) -> MailboxID:
     """
     Create a new mailbox.
 
+    :param buffer_size: Number of messages the mailbox can hold before `send()`
+                        blocks, with 0 every `send()` waits for a receiver
     :returns: The mailbox unique identifier
     """
 
-    mid = str(uuid4())
+    mid = next(_mailbox_ids)
 
-    mailbox_registry = context_mailbox_registry.get()
-    mailbox_registry[mid] = trio.open_memory_channel(0)
+    _mailbox_registry[mid] = trio.open_memory_channel(buffer_size)
 
     return mid
 
@@ -109,14 +115,12 @@ async def destroy(mid: MailboxID) -> None:
     :raises MailboxDoesNotExist: The mailbox identifier was not found
     """
 
-    mailbox_registry = context_mailbox_registry.get()
-
-    if mid not in mailbox_registry:
+    if mid not in _mailbox_registry:
         raise MailboxDoesNotExist(mid)
 
     unregister_all(mid)
 
-    wchan, rchan = mailbox_registry.pop(mid)
+    wchan, rchan = _mailbox_registry.pop(mid)
     await wchan.aclose()
     await rchan.aclose()
 
@@ -132,16 +136,14 @@ def register(mid: MailboxID, name: str) -> None:
     :raises NameAlreadyExist: The name was already registered
     """
 
-    mailbox_registry = context_mailbox_registry.get()
-
-    if mid not in mailbox_registry:
+    if mid not in _mailbox_registry:
         raise MailboxDoesNotExist(mid)
 
-    name_registry = context_name_registry.get()
-    if name in name_registry:
+    if name in _name_registry:
         raise NameAlreadyExist(name)
 
-    name_registry[name] = mid
+    _name_registry[name] = mid
+    _names_by_mailbox.setdefault(mid, set()).add(name)
 
 
 def unregister(name: str) -> None:
@@ -152,11 +154,15 @@ def unregister(name: str) -> None:
     :raises NameDoesNotExist: The name was not found
     """
 
-    name_registry = context_name_registry.get()
-    if name not in name_registry:
+    if name not in _name_registry:
         raise NameDoesNotExist(name)
 
-    name_registry.pop(name)
+    mid = _name_registry.pop(name)
+
+    names = _names_by_mailbox[mid]
+    names.discard(name)
+    if not names:
+        del _names_by_mailbox[mid]
 
 
 def unregister_all(mid: MailboxID) -> None:
@@ -166,19 +172,21 @@ def unregister_all(mid: MailboxID) -> None:
     :param mid: The mailbox identifier
     """
 
-    name_registry = context_name_registry.get()
-
-    for name, mailbox_id in list(name_registry.items()):
-        if mailbox_id == mid:
-            name_registry.pop(name)
+    for name in _names_by_mailbox.pop(mid, ()):
+        del _name_registry[name]
 
 
 @asynccontextmanager
-async def open(name: Optional[str] = None) -> AsyncContextManager[MailboxID]:
+async def open(
+    name: Optional[str] = None,
+    buffer_size: int = 0,
+) -> AsyncContextManager[MailboxID]:
     """
     Shortcut for `create()`, `register()` followed by a `destroy()`.
 
     :param name: Optional name to register the mailbox
+    :param buffer_size: Number of messages the mailbox can hold before `send()`
+                        blocks
     :returns: Asynchronous context manager for the mailbox
     :raises NameAlreadyExist: If the `name` was already registered
 
@@ -190,7 +198,7 @@ async def open(name: Optional[str] = None) -> AsyncContextManager[MailboxID]:
            print(message)
     """
 
-    mid = create()
+    mid = create(buffer_size)
 
     try:
         if name is not None:
@@ -203,8 +211,15 @@ async def open(name: Optional[str] = None) -> AsyncContextManager[MailboxID]:
 
 
 def _resolve(name: str) -> Optional[MailboxID]:
-    name_registry = context_name_registry.get()
-    return name_registry.get(name)
+    return _name_registry.get(name)
+
+
+def _get_receive_channel(mid: MailboxID) -> trio.MemoryReceiveChannel:
+    if mid not in _mailbox_registry:
+        raise MailboxDoesNotExist(mid)
+
+    _, rchan = _mailbox_registry[mid]
+    return rchan
 
 
 async def send(name_or_mid: Union[str, MailboxID], message: Any) -> None:
@@ -216,16 +231,18 @@ async def send(name_or_mid: Union[str, MailboxID], message: Any) -> None:
     :raises MailboxDoesNotExist: The mailbox was not found
     """
 
-    mailbox_registry = context_mailbox_registry.get()
-
-    mid = _resolve(name_or_mid)
-    if mid is None:
+    if type(name_or_mid) is int:
         mid = name_or_mid
 
-    if mid not in mailbox_registry:
+    else:
+        mid = _resolve(name_or_mid)
+        if mid is None:
+            mid = name_or_mid
+
+    if mid not in _mailbox_registry:
         raise MailboxDoesNotExist(mid)
 
-    wchan, _ = mailbox_registry.get(mid)
+    wchan, _ = _mailbox_registry.get(mid)
     await wchan.send(message)
 
 
@@ -248,23 +265,21 @@ async def receive(
                                no message was received during the timespan set
     """
 
-    mailbox_registry = context_mailbox_registry.get()
-
-    if mid not in mailbox_registry:
+    channels = _mailbox_registry.get(mid)
+    if channels is None:
         raise MailboxDoesNotExist(mid)
 
-    _, rchan = mailbox_registry.get(mid)
+    rchan = channels[1]
 
-    if timeout is not None:
-        try:
-            with trio.fail_after(timeout):
-                return await rchan.receive()
+    if timeout is None:
+        return await rchan.receive()
 
-        except trio.TooSlowError:
-            if on_timeout is None:
-                raise
+    try:
+        with trio.fail_after(timeout):
+            return await rchan.receive()
 
-            return await on_timeout()
+    except trio.TooSlowError:
+        if on_timeout is None:
+            raise
 
-    else:
-        return await rchan.receive()
+        return await on_timeout()
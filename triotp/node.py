@@ -5,6 +5,9 @@ list of application to start.
    **NB:** There is no dependency management between applications, it's up to
    you to start the correct applications in the right order.
 
+   **NB:** The mailbox registry is shared by the whole process, only one node
+   can run at a time.
+
 .. code-block:: python
    :caption: Example
 
@@ -39,6 +42,7 @@ def run(
     apps: list[application.app_spec],
     loglevel: logging.LogLevel = logging.LogLevel.NONE,
     logformat: Optional[str] = None,
+    parallel_start: bool = False,
 ) -> None:
     """
     Start a new node by calling `trio.run`.
@@ -46,6 +50,9 @@ def run(
     :param apps: List of application to start
     :param loglevel: Logging Level of the node
     :param logformat: Format of log messages produced by the node
+    :param parallel_start: If `True`, start the applications concurrently
+                           instead of one after the other, only use it when
+                           the applications do not depend on each other
     """
 
     match loglevel:
@@ -59,14 +66,26 @@ def run(
         handler.format_string = logformat
 
     with handler.applicationbound():
-        trio.run(_start, apps)
+        trio.run(_start, apps, parallel_start)
 
 
-async def _start(apps: list[application.app_spec]) -> None:
+async def _start(apps: list[application.app_spec], parallel_start: bool) -> None:
     mailbox._init()
 
     async with trio.open_nursery() as nursery:
         application._init(nursery)
 
-        for app_spec in apps:
-            await application.start(app_spec)
+        if parallel_start:
+            # An application is registered only once started, keep the first
+            # spec of each module so that concurrent starts cannot race
+            unique_apps: dict[str, application.app_spec] = {}
+            for app_spec in apps:
+                unique_apps.setdefault(app_spec.module.__name__, app_spec)
+
+            async with trio.open_nursery() as start_nursery:
+                for app_spec in unique_apps.values():
+                    start_nursery.start_soon(application.start, app_spec)
+
+        else:
+            for app_spec in apps:
+                await application.start(app_spec)
@@ -34,19 +34,22 @@ restarting them if they exit prematurely or if they crash.
 """
 
 from dataclasses import dataclass
-from collections import deque
-from enum import Enum, auto
+from array import array
+from enum import IntEnum, auto
+from functools import lru_cache
 from logbook import Logger
-import tenacity
-
-import trio_util
+import random
 import trio
+import sys
 
 from collections.abc import Callable, Awaitable
-from typing import Any
+from typing import Any, Optional
+
+if sys.version_info < (3, 11):
+    from exceptiongroup import BaseExceptionGroup
 
 
-class restart_strategy(Enum):
+class restart_strategy(IntEnum):
     """
     Describe when to restart an asynchronous task.
     """
@@ -56,7 +59,7 @@ class restart_strategy(Enum):
     TEMPORARY = auto()  #: Never restart a task
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class child_spec:
     """
     Describe an asynchronous task to supervise.
@@ -68,7 +71,7 @@ class child_spec:
     restart: restart_strategy = restart_strategy.PERMANENT  #: When to restart the task
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class options:
     """
     Describe the options for the supervisor.
@@ -76,58 +79,157 @@ class options:
 
     max_restarts: int = 3  #: Maximum number of restart during a limited timespan
     max_seconds: int = 5  #: Timespan duration
+    base_delay: float = 0.0  #: Initial upper bound of the delay before a restart
+    max_delay: float = 30.0  #: Maximum upper bound of the delay before a restart
 
 
 class _retry_strategy:
+    __slots__ = (
+        "max_restarts",
+        "max_seconds",
+        "base_delay",
+        "max_delay",
+        "should_restart",
+        "_attempt",
+        "_failure_times",
+        "_head",
+        "_count",
+    )
+
     def __init__(
         self,
         restart: restart_strategy,
         max_restarts: int,
         max_seconds: float,
+        base_delay: float,
+        max_delay: float,
     ):
-        self.restart = restart
         self.max_restarts = max_restarts
         self.max_seconds = max_seconds
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._attempt = 0
 
-        self.failure_times = deque()
+        # Ring buffer holding the time of the last `max_restarts` failures,
+        # `_head` is the slot of the next failure to record. Once the buffer
+        # is full, this slot holds the oldest failure.
+        self._failure_times = array("d", [0.0] * max_restarts)
+        self._head = 0
+        self._count = 0
+
+        # The restart strategy never changes, pick the decision once. Without
+        # a timespan, the restart intensity can never be exceeded and there
+        # is no need to read the clock nor to record the failures. Without
+        # restarts, it is exceeded by the first one.
+        match restart:
+            case restart_strategy.PERMANENT if max_seconds <= 0:
+                self.should_restart = self._should_restart_always
+
+            case restart_strategy.TRANSIENT if max_seconds <= 0:
+                self.should_restart = self._should_restart_on_failure
+
+            case _ if max_restarts <= 0:
+                self.should_restart = self._should_restart_temporary
 
-    def __call__(self, retry_state: tenacity.RetryCallState):
-        match self.restart:
             case restart_strategy.PERMANENT:
-                pass
+                self.should_restart = self._should_restart_permanent
 
             case restart_strategy.TRANSIENT:
-                if not retry_state.outcome.failed:
-                    return False
+                self.should_restart = self._should_restart_transient
 
             case restart_strategy.TEMPORARY:
-                return False
+                self.should_restart = self._should_restart_temporary
+
+    def _should_restart_permanent(
+        self,
+        exc: Optional[BaseException],
+        _now: Callable[[], float] = trio.current_time,
+    ) -> bool:
+        now = _now()
+        head = self._head
+        failure_times = self._failure_times
+
+        # Once the last failure is older than the timespan, the previous ones
+        # can no longer exceed the restart intensity: start over from this one,
+        # with the backoff as well
+        if self._count and now - failure_times[head - 1] >= self.max_seconds:
+            self._count = 0
+            self._attempt = 0
+
+        if self._count < self.max_restarts:
+            self._count += 1
+            should_restart = True
+
+        else:
+            # The new failure takes the slot of the oldest one
+            should_restart = now - failure_times[head] >= self.max_seconds
+
+        failure_times[head] = now
+
+        head += 1
+        if head == self.max_restarts:
+            head = 0
+
+        self._head = head
+        return should_restart
+
+    def _should_restart_transient(self, exc: Optional[BaseException]) -> bool:
+        return exc is not None and self._should_restart_permanent(exc)
+
+    def _should_restart_temporary(self, exc: Optional[BaseException]) -> bool:
+        return False
+
+    def _should_restart_always(self, exc: Optional[BaseException]) -> bool:
+        return True
 
-        now = trio.current_time()
-        self.failure_times.append(now)
+    def _should_restart_on_failure(self, exc: Optional[BaseException]) -> bool:
+        return exc is not None
 
-        if len(self.failure_times) <= self.max_restarts:
-            return True
+    def delay(self, exc: Optional[BaseException]) -> float:
+        # Exponential backoff with full jitter, reset by a clean exit or when
+        # the failure window starts over
+        if exc is None:
+            self._attempt = 0
 
-        oldest_failure = self.failure_times.popleft()
-        return now - oldest_failure >= self.max_seconds
+        max_delay = self.base_delay * 2**self._attempt
+        if max_delay >= self.max_delay:
+            max_delay = self.max_delay
+
+        elif max_delay > 0:
+            self._attempt += 1
+
+        return random.uniform(0, max_delay)
+
+
+@lru_cache(maxsize=1024)
+def _logger_for(child_id: str) -> Logger:
+    return Logger(child_id)
 
 
 class _retry_logger:
+    __slots__ = ("child_id", "_logger")
+
     def __init__(self, child_id: str):
-        self.logger = Logger(child_id)
+        self.child_id = child_id
+        # Most children never restart, the logger is created on first use
+        self._logger: Optional[Logger] = None
 
-    def __call__(self, retry_state: tenacity.RetryCallState) -> None:
-        if isinstance(retry_state.outcome.exception(), trio.Cancelled):
-            self.logger.info("task cancelled")
+    def __call__(self, exc: Optional[BaseException]) -> None:
+        logger = self._logger
+        if logger is None:
+            logger = self._logger = _logger_for(self.child_id)
 
-        elif retry_state.outcome.failed:
-            exception = retry_state.outcome.exception()
-            exc_info = (exception.__class__, exception, exception.__traceback__)
-            self.logger.error("restarting task after failure", exc_info=exc_info)
+        if isinstance(exc, trio.Cancelled):
+            logger.info("task cancelled")
+
+        elif exc is not None:
+            # Called from the `except` block handling the failure, Logbook
+            # fetches the exception info only if a handler needs the record
+            logger.error("restarting task after failure", exc_info=True)
 
         else:
-            self.logger.error("restarting task after unexpected exit")
+            logger.error("restarting task after unexpected exit")
 
 
 async def start(
@@ -164,27 +266,62 @@ async def start(
 
     async with trio.open_nursery() as nursery:
         for spec in child_specs:
-            await nursery.start(_child_monitor, spec, opts)
+            await nursery.start(_supervise_one, spec, opts)
 
         task_status.started(None)
 
 
-async def _child_monitor(
+async def _supervise_one(
     spec: child_spec,
     opts: options,
     task_status=trio.TASK_STATUS_IGNORED,
 ) -> None:
+    strategy = _retry_strategy(
+        spec.restart,
+        opts.max_restarts,
+        opts.max_seconds,
+        opts.base_delay,
+        opts.max_delay,
+    )
+    should_restart = strategy.should_restart
+    log_restart = _retry_logger(spec.id)
+    task, args = spec.task, spec.args
+
+    # The first run of the task happens in the same step, up to its first
+    # checkpoint, before the next child is started.
     task_status.started(None)
 
-    @tenacity.retry(
-        retry=_retry_strategy(spec.restart, opts.max_restarts, opts.max_seconds),
-        reraise=True,
-        sleep=trio.sleep,
-        after=_retry_logger(spec.id),
-    )
-    async def _child_runner():
-        with trio_util.defer_to_cancelled():
-            async with trio.open_nursery() as nursery:
-                nursery.start_soon(spec.task, *spec.args)
+    while True:
+        try:
+            await task(*args)
+
+        except trio.Cancelled as exc:
+            log_restart(exc)
+            raise
+
+        except BaseException as exc:
+            # An exception group made only of trio.Cancelled is replaced by
+            # one of them, so that the cancellation reaches its cancel scope.
+            if isinstance(exc, BaseExceptionGroup):
+                cancelled, others = exc.split(trio.Cancelled)
+                if others is None:
+                    while isinstance(cancelled, BaseExceptionGroup):
+                        cancelled = cancelled.exceptions[0]
+
+                    log_restart(cancelled)
+                    raise cancelled
+
+            if not should_restart(exc):
+                raise
+
+            log_restart(exc)
+            delay = strategy.delay(exc)
+
+        else:
+            if not should_restart(None):
+                return
+
+            log_restart(None)
+            delay = strategy.delay(None)
 
-    await _child_runner()
+        await trio.sleep(delay)